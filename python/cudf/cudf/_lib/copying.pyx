@@ -191,6 +191,27 @@ def gather(
     return columns_from_unique_ptr(move(c_result))
 
 
+def sample(list columns, size_type n, bool replace, int64_t seed):
+    """Sample `n` rows of `columns`, with or without replacement.
+
+    Rows are drawn by libcudf, which shuffles the row positions on the
+    device rather than sorting random keys.
+    """
+    cdef unique_ptr[table] c_result
+    cdef table_view source_table_view = table_view_from_columns(columns)
+    cdef cpp_copying.sample_with_replacement c_replace = (
+        cpp_copying.sample_with_replacement.TRUE if replace
+        else cpp_copying.sample_with_replacement.FALSE
+    )
+
+    with nogil:
+        c_result = move(
+            cpp_copying.sample(source_table_view, n, c_replace, seed)
+        )
+
+    return columns_from_unique_ptr(move(c_result))
+
+
 cdef scatter_scalar(list source_device_slrs,
                     column_view scatter_map,
                     table_view target_table,
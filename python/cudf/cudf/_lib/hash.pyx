@@ -54,9 +54,9 @@ def hash_partition(source_table, object columns_to_hash,
     )
 
 
-def hash(source_table, str method, int seed=0):
+def hash(source_table, str method, int seed=0, bool ignore_index=True):
     cdef table_view c_source_view = table_view_from_table(
-        source_table, ignore_index=True)
+        source_table, ignore_index=ignore_index)
     cdef unique_ptr[column] c_result
     cdef cpp_hash_id c_hash_function
     if method == "murmur3":
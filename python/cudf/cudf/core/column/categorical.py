@@ -858,6 +858,10 @@ class CategoricalColumn(column.ColumnBase):
         result = self if inplace else self.copy()
 
         libcudf.filling.fill_in_place(result.codes, begin, end, fill_scalar)
+        if inplace:
+            # The fill rewrites the codes child, so cached properties of this
+            # column (such as monotonicity) are stale.
+            self._clear_cache()
         return result
 
     def slice(
@@ -309,6 +309,14 @@ class ColumnBase(Column, Serializable, Reducible, NotIterable):
             self.base_mask, self.offset, self.offset + len(self)
         )
 
+    def _clear_cache(self):
+        super()._clear_cache()
+        for attr in ("is_monotonic_increasing", "is_monotonic_decreasing"):
+            try:
+                delattr(self, attr)
+            except AttributeError:
+                pass
+
     @cached_property
     def memory_usage(self) -> int:
         n = 0
@@ -346,6 +354,7 @@ class ColumnBase(Column, Serializable, Reducible, NotIterable):
             self.set_base_mask(mask)
 
         libcudf.filling.fill_in_place(self, begin, end, slr.device_value)
+        self._clear_cache()
 
         return self
 
@@ -797,13 +806,13 @@ class ColumnBase(Column, Serializable, Reducible, NotIterable):
     def is_unique(self) -> bool:
         return self.distinct_count() == len(self)
 
-    @property
+    @cached_property
     def is_monotonic_increasing(self) -> bool:
         return not self.has_nulls() and self.as_frame()._is_sorted(
             ascending=None, null_position=None
         )
 
-    @property
+    @cached_property
     def is_monotonic_decreasing(self) -> bool:
         return not self.has_nulls() and self.as_frame()._is_sorted(
             ascending=[False], null_position=None
@@ -10,6 +10,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     Mapping,
     Optional,
     Tuple,
@@ -212,6 +213,14 @@ class ColumnAccessor(MutableMapping):
     def columns(self) -> Tuple[ColumnBase, ...]:
         return tuple(self.values())
 
+    @cached_property
+    def _sorted_names(self) -> Tuple[Any, ...]:
+        return tuple(sorted(self.names))
+
+    @cached_property
+    def _name_to_position(self) -> Dict[Any, int]:
+        return {name: i for i, name in enumerate(self.names)}
+
     @cached_property
     def _grouped_data(self) -> MutableMapping:
         """
@@ -231,7 +240,13 @@ class ColumnAccessor(MutableMapping):
             return 0
 
     def _clear_cache(self):
-        cached_properties = ("columns", "names", "_grouped_data")
+        cached_properties = (
+            "columns",
+            "names",
+            "_sorted_names",
+            "_name_to_position",
+            "_grouped_data",
+        )
         for attr in cached_properties:
             try:
                 self.__delattr__(attr)
@@ -303,6 +318,15 @@ class ColumnAccessor(MutableMapping):
             self._data = self._data.__class__(zip(new_keys, new_values))
         self._clear_cache()
 
+    def _drop_many(self, keys: Iterable):
+        """
+        Remove the columns with the given keys, clearing the cached
+        properties once rather than once per key.
+        """
+        for key in keys:
+            del self._data[key]
+        self._clear_cache()
+
     def copy(self, deep=False) -> ColumnAccessor:
         """
         Make a copy of this ColumnAccessor.
@@ -553,6 +577,7 @@ class ColumnAccessor(MutableMapping):
         self._level_names = (
             self._level_names[:level] + self._level_names[level + 1 :]
         )
+        self._clear_cache()
 
         if (
             len(self._level_names) == 1
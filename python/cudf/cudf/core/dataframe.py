@@ -1330,8 +1330,10 @@ class DataFrame(IndexedFrame, Serializable, GetAttrGetItemMixin):
 
     @annotate("DATAFRAME_MEMORY_USAGE", color="blue", domain="cudf_python")
     def memory_usage(self, index=True, deep=False):
-        return Series(
-            {str(k): v for k, v in super().memory_usage(index, deep).items()}
+        names, usages = super().memory_usage(index, deep)
+        return Series._from_data(
+            {None: as_column(usages, dtype="int64")},
+            index=as_index([str(name) for name in names]),
         )
 
     @annotate("DATAFRAME_ARRAY_FUNCTION", color="blue", domain="cudf_python")
@@ -153,7 +153,8 @@ class Frame(BinaryOperand, Scannable):
 
     @property
     def _column_names(self) -> Tuple[Any, ...]:  # TODO: Tuple[str]?
-        return tuple(self._data.names)
+        # ColumnAccessor caches its names and invalidates them on mutation.
+        return self._data.names
 
     @property
     def _index_names(self) -> Optional[Tuple[Any, ...]]:  # TODO: Tuple[str]?
@@ -167,7 +168,7 @@ class Frame(BinaryOperand, Scannable):
 
     @property
     def _columns(self) -> Tuple[Any, ...]:  # TODO: Tuple[Column]?
-        return tuple(self._data.columns)
+        return self._data.columns
 
     def serialize(self):
         header = {
@@ -415,14 +416,18 @@ class Frame(BinaryOperand, Scannable):
 
         Returns
         -------
-        The total bytes used.
+        Tuple[List, List]
+            The names of the columns and the bytes used by each of them.
         """
         if deep:
             warnings.warn(
                 "The deep parameter is ignored and is only included "
                 "for pandas compatibility."
             )
-        return {name: col.memory_usage for name, col in self._data.items()}
+        return (
+            list(self._data.names),
+            [col.memory_usage for col in self._data.columns],
+        )
 
     def __len__(self):
         return self._num_rows
@@ -1831,11 +1836,10 @@ class Frame(BinaryOperand, Scannable):
         The order of indices returned corresponds to the column order in this
         Frame.
         """
-        return [
-            i
-            for i, name in enumerate(self._column_names)
-            if name in set(column_names)
-        ]
+        positions = self._data._name_to_position
+        return sorted(
+            {positions[name] for name in column_names if name in positions}
+        )
 
     @annotate("FRAME_REPLACE", color="green", domain="cudf_python")
     def replace(
@@ -6551,59 +6555,20 @@ def _drop_rows_by_labels(
         if errors == "raise" and not labels.isin(levels_index).all():
             raise KeyError("One or more values not found in axis")
 
-        if isinstance(level, int):
-            ilevel = level
-        else:
-            ilevel = obj._index.names.index(level)
-
-        # 1. Merge Index df and data df along column axis:
-        # | id | ._index df | data column(s) |
-        idx_nlv = obj._index.nlevels
-        working_df = obj._index.to_frame(index=False)
-        working_df.columns = [i for i in range(idx_nlv)]
-        for i, col in enumerate(obj._data):
-            working_df[idx_nlv + i] = obj._data[col]
-        # 2. Set `level` as common index:
-        # | level | ._index df w/o level | data column(s) |
-        working_df = working_df.set_index(level)
-
-        # 3. Use "leftanti" join to drop
-        # TODO: use internal API with "leftanti" and specify left and right
-        # join keys to bypass logic check
-        to_join = cudf.DataFrame(index=cudf.Index(labels, name=level))
-        join_res = working_df.join(to_join, how="leftanti")
-
-        # 4. Reconstruct original layout, and rename
-        join_res._insert(
-            ilevel, name=join_res._index.name, value=join_res._index
-        )
-
-        midx = cudf.MultiIndex.from_frame(
-            join_res.iloc[:, 0:idx_nlv], names=obj._index.names
-        )
-
-        if isinstance(obj, cudf.Series):
-            return obj.__class__._from_data(
-                join_res.iloc[:, idx_nlv:]._data, index=midx, name=obj.name
-            )
-        else:
-            return obj.__class__._from_data(
-                join_res.iloc[:, idx_nlv:]._data,
-                index=midx,
-                columns=obj._data.to_pandas_index(),
-            )
-
+        index_column = levels_index._values
     else:
         if errors == "raise" and not labels.isin(obj.index).all():
             raise KeyError("One or more values not found in axis")
 
-        key_df = cudf.DataFrame(index=labels)
-        if isinstance(obj, cudf.DataFrame):
-            return obj.join(key_df, how="leftanti")
-        else:
-            res = obj.to_frame(name="tmp").join(key_df, how="leftanti")["tmp"]
-            res.name = obj.name
-            return res
+        index_column = obj._index._values
+
+    # Keep every row whose label is not being dropped.
+    res = obj._apply_boolean_mask(
+        index_column.isin(labels).unary_operator("not")
+    )
+    res._data.multiindex = obj._data.multiindex
+    res._data._level_names = obj._data._level_names
+    return res
 
 
 def _apply_inverse_column(col: ColumnBase) -> ColumnBase:
@@ -830,7 +830,7 @@ class GenericIndex(SingleColumnFrame, BaseIndex):
             return ret
 
         # Attempt to dispatch all other functions to cupy.
-        cupy_func = getattr(cupy, ufunc.__name__)
+        cupy_func = getattr(cupy, ufunc.__name__, None)
         if cupy_func:
             if ufunc.nin == 2:
                 other = inputs[self is inputs[0]]
@@ -921,7 +921,7 @@ class GenericIndex(SingleColumnFrame, BaseIndex):
 
     @annotate("GENERICINDEX_MEMORY_USAGE", color="green", domain="cudf_python")
     def memory_usage(self, deep=False):
-        return sum(super().memory_usage(deep=deep).values())
+        return sum(super().memory_usage(deep=deep)[1])
 
     @annotate("INDEX_EQUALS", color="green", domain="cudf_python")
     def equals(self, other, **kwargs):
@@ -3,13 +3,13 @@
 
 from __future__ import annotations
 
+import itertools
 import numbers
 import operator
 import warnings
 from collections import Counter, abc
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar, Union
-from uuid import uuid4
 
 import cupy as cp
 import numpy as np
@@ -33,6 +33,7 @@ from cudf.core.frame import Frame, _drop_rows_by_labels
 from cudf.core.index import Index, RangeIndex, _index_from_columns
 from cudf.core.multiindex import MultiIndex
 from cudf.core.udf.utils import _compile_or_get, _supported_cols_from_frame
+from cudf.utils import cudautils
 
 doc_reset_index_template = """
         Reset the index of the {klass}, or a level of it.
@@ -60,24 +61,38 @@ doc_reset_index_template = """
 """
 
 
+# Binary ufuncs for which pandas returns bools on misaligned indexes.
+_BITWISE_UFUNCS = frozenset({"bitwise_and", "bitwise_or", "bitwise_xor"})
+
+# Suffixes for the temporary ordering column used by
+# ``IndexedFrame._align_to_index``.
+_align_sort_ids = itertools.count()
+
+
+@lru_cache(maxsize=128)
+def _to_offset(offset: str) -> pd.DateOffset:
+    """Cached ``pd.tseries.frequencies.to_offset`` for string offsets."""
+    return pd.tseries.frequencies.to_offset(offset)
+
+
 def _get_host_unique(array):
     if isinstance(array, (cudf.Series, cudf.Index, ColumnBase)):
-        return array.unique.to_pandas()
+        return array.unique().to_pandas()
     elif isinstance(array, (str, numbers.Number)):
         return [array]
     else:
-        return set(array)
+        # Deduplicate on the host, keeping the caller's order.
+        return list(dict.fromkeys(array))
 
 
 def _drop_columns(f: Frame, columns: abc.Iterable, errors: str):
+    to_drop = {}
     for c in columns:
-        try:
-            f._drop_column(c)
-        except KeyError as e:
-            if errors == "ignore":
-                pass
-            else:
-                raise e
+        if c in f._data:
+            to_drop[c] = None
+        elif errors != "ignore":
+            raise KeyError(f"column '{c}' does not exist")
+    f._data._drop_many(to_drop)
 
 
 def _indices_from_labels(obj, labels):
@@ -95,6 +110,12 @@ def _indices_from_labels(obj, labels):
             )
         else:
             labels = labels.astype(obj.index.dtype)
+            if (
+                not isinstance(obj.index, MultiIndex)
+                and obj.index.is_unique
+                and obj.index.is_monotonic_increasing
+            ):
+                return _indices_from_sorted_labels(obj.index._values, labels)
 
     # join is not guaranteed to maintain the index ordering
     # so we will sort it with its initial ordering which is stored
@@ -105,7 +126,31 @@ def _indices_from_labels(obj, labels):
     rhs = cudf.DataFrame(
         {"_": cudf.core.column.arange(len(obj))}, index=obj.index
     )
-    return lhs.join(rhs).sort_values("__")["_"]
+    joined = lhs.join(rhs)._data
+    order = libcudf.sort.order_by(joined["__"].as_frame(), [True], "last")
+    return cudf.Series._from_data(
+        {None: libcudf.copying.gather([joined["_"]], order)[0]}
+    )
+
+
+def _indices_from_sorted_labels(index_column, labels):
+    """Positions of `labels` in a unique, monotonically increasing index.
+
+    Labels that are not present in the index are mapped to null.
+    """
+    positions = libcudf.search.search_sorted(
+        index_column.as_frame(), labels.as_frame(), "left"
+    )
+    # A label is found only if the value at its insertion point matches it.
+    # Labels greater than every index value are inserted past the end, which
+    # the nullifying gather maps to null.
+    candidates = libcudf.copying.gather(
+        [index_column], positions, nullify=True
+    )[0]
+    positions = positions.set_mask(
+        libcudf.transform.bools_to_mask(candidates == labels)
+    )
+    return cudf.Series._from_data({None: positions})
 
 
 def _get_label_range_or_mask(index, start, stop, step):
@@ -116,17 +161,26 @@ def _get_label_range_or_mask(index, start, stop, step):
     ):
         start = pd.to_datetime(start)
         stop = pd.to_datetime(stop)
-        if start is not None and stop is not None:
-            if start > stop:
-                return slice(0, 0, None)
-            # TODO: Once Index binary ops are updated to support logical_and,
-            # can use that instead of using cupy.
-            boolean_mask = cp.logical_and((index >= start), (index <= stop))
-        elif start is not None:
-            boolean_mask = index >= start
-        else:
-            boolean_mask = index <= stop
-        return boolean_mask
+        if start is not None and stop is not None and start > stop:
+            return slice(0, 0, None)
+        # Compare against the underlying integer representation so that
+        # both bounds are checked in a single kernel, with a missing bound
+        # replaced by the extreme value of the integer range.
+        column = index._values
+        bounds = np.iinfo(np.int64)
+        lo = (
+            bounds.min
+            if start is None
+            else start.to_datetime64().astype(column.dtype).astype(np.int64)
+        )
+        hi = (
+            bounds.max
+            if stop is None
+            else stop.to_datetime64().astype(column.dtype).astype(np.int64)
+        )
+        return cudautils.mark_in_range(
+            column.as_numerical.data_array_view, lo, hi, mask=column.mask
+        )
     else:
         start, stop = index.find_label_range(start, stop)
         return slice(start, stop, step)
@@ -464,31 +518,29 @@ class IndexedFrame(Frame):
                 inds = idx._get_sorted_inds(
                     ascending=ascending, na_position=na_position
                 )
-                out = self._gather(inds)
-                # TODO: frame factory function should handle multilevel column
-                # names
-                if (
-                    isinstance(self, cudf.core.dataframe.DataFrame)
-                    and self._data.multiindex
-                ):
-                    out._set_column_names_like(self)
             elif (ascending and idx.is_monotonic_increasing) or (
                 not ascending and idx.is_monotonic_decreasing
             ):
-                out = self.copy()
+                inds = None
             else:
                 inds = idx.argsort(
                     ascending=ascending, na_position=na_position
                 )
-                out = self._gather(inds)
-                if (
-                    isinstance(self, cudf.core.dataframe.DataFrame)
-                    and self._data.multiindex
-                ):
-                    out._set_column_names_like(self)
+
+            if inds is None:
+                out = self.copy()
+            else:
+                out = self._gather(inds, check_bounds=False)
+                # TODO: frame factory function should handle multilevel column
+                # names
+                if self._data.multiindex:
+                    # The gathered columns keep the names and order of self,
+                    # only the multilevel metadata needs to be restored.
+                    out._data.multiindex = True
+                    out._data._level_names = self._data._level_names
         else:
-            labels = sorted(self._data.names, reverse=not ascending)
-            out = self[labels]
+            labels = self._data._sorted_names
+            out = self[list(labels if ascending else reversed(labels))]
 
         if ignore_index is True:
             out = out.reset_index(drop=True)
@@ -551,10 +603,11 @@ class IndexedFrame(Frame):
         >>> s.memory_usage(index=False)
         24
         """
-        usage = super().memory_usage(deep=deep)
+        names, usages = super().memory_usage(deep=deep)
         if index:
-            usage["Index"] = self.index.memory_usage()
-        return usage
+            names.append("Index")
+            usages.append(self.index.memory_usage())
+        return names, usages
 
     def hash_values(self, method="murmur3"):
         """Compute the hash of values in this column.
@@ -628,21 +681,22 @@ class IndexedFrame(Frame):
         Skip bounds checking if check_bounds is False.
         Set rows to null for all out of bound indices if nullify is `True`.
         """
-        gather_map = cudf.core.column.as_column(gather_map)
+        if not isinstance(gather_map, ColumnBase):
+            gather_map = cudf.core.column.as_column(gather_map)
 
         # TODO: For performance, the check and conversion of gather map should
         # be done by the caller. This check will be removed in future release.
         if not is_integer_dtype(gather_map.dtype):
             gather_map = gather_map.astype("int32")
 
-        if not libcudf.copying._gather_map_is_valid(
+        if check_bounds and not libcudf.copying._gather_map_is_valid(
             gather_map, len(self), check_bounds, nullify
         ):
             raise IndexError("Gather map index is out of bounds.")
 
         return self._from_columns_like_self(
             libcudf.copying.gather(
-                list(self._index._columns + self._columns)
+                [*self._index._columns, *self._columns]
                 if keep_index
                 else list(self._columns),
                 gather_map,
@@ -664,11 +718,14 @@ class IndexedFrame(Frame):
         num_index_columns = (
             len(self._index._data) if offset_by_index_columns else 0
         )
-        return [
-            i + num_index_columns
-            for i, name in enumerate(self._column_names)
-            if name in set(column_names)
-        ]
+        positions = self._data._name_to_position
+        return sorted(
+            {
+                positions[name] + num_index_columns
+                for name in column_names
+                if name in positions
+            }
+        )
 
     def drop_duplicates(
         self,
@@ -699,21 +756,22 @@ class IndexedFrame(Frame):
             and subset in self._data.names
         ):
             subset = (subset,)
-        diff = set(subset) - set(self._data)
+        subset = set(subset)
+        diff = subset - set(self._data)
         if len(diff) != 0:
             raise KeyError(f"columns {diff} do not exist")
-        subset_cols = [name for name in self._column_names if name in subset]
-        if len(subset_cols) == 0:
-            return self.copy(deep=True)
 
         keys = self._positions_from_column_names(
             subset, offset_by_index_columns=not ignore_index
         )
+        if len(keys) == 0:
+            return self.copy(deep=True)
+
         return self._from_columns_like_self(
             libcudf.stream_compaction.drop_duplicates(
                 list(self._columns)
                 if ignore_index
-                else list(self._index._columns + self._columns),
+                else [*self._index._columns, *self._columns],
                 keys=keys,
                 keep=keep,
                 nulls_are_equal=nulls_are_equal,
@@ -744,13 +802,11 @@ class IndexedFrame(Frame):
             splits,
         )
 
+        column_names = self._column_names
+        index_names = self._index.names if keep_index else None
         return [
-            self._from_columns_like_self(
-                columns_split[i],
-                self._column_names,
-                self._index.names if keep_index else None,
-            )
-            for i in range(len(splits) + 1)
+            self._from_columns_like_self(columns, column_names, index_names)
+            for columns in columns_split
         ]
 
     def add_prefix(self, prefix):
@@ -887,31 +943,35 @@ class IndexedFrame(Frame):
             ) from e
 
         # Mask and data column preallocated
-        ans_col = cp.empty(len(self), dtype=retty)
-        ans_mask = cudf.core.column.column_empty(len(self), dtype="bool")
-        launch_args = [(ans_col, ans_mask), len(self)]
-        offsets = []
+        size = len(self)
+        ans_col = cp.empty(size, dtype=retty)
+        # The kernel sets the validity bits of rows with a valid result, so
+        # the bitmask starts out with every row null.
+        ans_mask = libcudf.null_mask.create_null_mask(
+            size, state=libcudf.null_mask.MaskState.ALL_NULL
+        )
 
         # if _compile_or_get succeeds, it is safe to create a kernel that only
         # consumes the columns that are of supported dtype
-        for col in _supported_cols_from_frame(self).values():
-            data = col.data
-            mask = col.mask
-            if mask is None:
-                launch_args.append(data)
-            else:
-                launch_args.append((data, mask))
-            offsets.append(col.offset)
-        launch_args += offsets
-        launch_args += list(args)
+        cols = list(_supported_cols_from_frame(self).values())
+        launch_args = [
+            (ans_col, cp.asarray(ans_mask).view(np.int32)),
+            size,
+            *(
+                col.data if col.mask is None else (col.data, col.mask)
+                for col in cols
+            ),
+            *(col.offset for col in cols),
+            *args,
+        ]
 
         try:
-            kernel.forall(len(self))(*launch_args)
+            kernel.forall(size)(*launch_args)
         except Exception as e:
             raise RuntimeError("UDF kernel execution failed.") from e
 
         col = cudf.core.column.as_column(ans_col)
-        col.set_base_mask(libcudf.transform.bools_to_mask(ans_mask))
+        col.set_base_mask(ans_mask)
         result = cudf.Series._from_data({None: col}, self._index)
 
         return result
@@ -983,18 +1043,28 @@ class IndexedFrame(Frame):
         if len(self) == 0:
             return self
 
+        to_sort = self._get_columns_by_label(by)
+        if to_sort._num_columns == 1 and not is_list_like(ascending):
+            col = to_sort._columns[0]
+            if (ascending and col.is_monotonic_increasing) or (
+                not ascending and col.is_monotonic_decreasing
+            ):
+                out = self.copy()
+                if ignore_index:
+                    out._index = RangeIndex(len(out))
+                return out
+
         # argsort the `by` column
         out = self._gather(
-            self._get_columns_by_label(by)._get_sorted_inds(
+            to_sort._get_sorted_inds(
                 ascending=ascending, na_position=na_position
             ),
             keep_index=not ignore_index,
+            check_bounds=False,
         )
-        if (
-            isinstance(self, cudf.core.dataframe.DataFrame)
-            and self._data.multiindex
-        ):
-            out.columns = self._data.to_pandas_index()
+        if self._data.multiindex:
+            out._data.multiindex = True
+            out._data._level_names = self._data._level_names
         return out
 
     def _n_largest_or_smallest(self, largest, n, columns, keep):
@@ -1005,10 +1075,16 @@ class IndexedFrame(Frame):
         if len(self) == 0:
             return self
 
-        if keep == "first":
-            if n < 0:
-                n = 0
+        if keep not in {"first", "last"}:
+            raise ValueError('keep must be either "first", "last"')
+
+        if n <= 0:
+            # Nothing to select, so there is no need to sort.
+            return self._gather(
+                cudf.core.column.arange(0), keep_index=True, check_bounds=False
+            )
 
+        if keep == "first":
             # argsort the `by` column
             return self._gather(
                 self._get_columns_by_label(columns)._get_sorted_inds(
@@ -1017,19 +1093,13 @@ class IndexedFrame(Frame):
                 keep_index=True,
                 check_bounds=False,
             )
-        elif keep == "last":
+        else:
             indices = self._get_columns_by_label(columns)._get_sorted_inds(
                 ascending=largest
             )
-
-            if n <= 0:
-                # Empty slice.
-                indices = indices[0:0]
-            else:
-                indices = indices[: -n - 1 : -1]
-            return self._gather(indices, keep_index=True, check_bounds=False)
-        else:
-            raise ValueError('keep must be either "first", "last"')
+            return self._gather(
+                indices[: -n - 1 : -1], keep_index=True, check_bounds=False
+            )
 
     def _align_to_index(
         self: T,
@@ -1046,23 +1116,47 @@ class IndexedFrame(Frame):
             if not self.index.is_unique or not index.is_unique:
                 raise ValueError("Cannot align indices with non-unique values")
 
-        lhs = cudf.DataFrame._from_data(self._data, index=self.index)
-        rhs = cudf.DataFrame._from_data({}, index=index)
-
-        # create a temporary column that we will later sort by
-        # to recover ordering after index alignment.
-        sort_col_id = str(uuid4())
-        if how == "left":
-            lhs[sort_col_id] = cudf.core.column.arange(len(lhs))
-        elif how == "right":
-            rhs[sort_col_id] = cudf.core.column.arange(len(rhs))
-
-        result = lhs.join(rhs, how=how, sort=sort)
-        if how in ("left", "right"):
-            result = result.sort_values(sort_col_id)
-            del result[sort_col_id]
-
-        result = self.__class__._from_data(result._data, index=result.index)
+        if (
+            how == "right"
+            and not isinstance(self.index, MultiIndex)
+            and not isinstance(index, MultiIndex)
+            and self.index.dtype == index.dtype
+            and not is_categorical_dtype(index.dtype)
+            and not self.index._values.has_nulls()
+            and self.index.is_unique
+            and self.index.is_monotonic_increasing
+        ):
+            # Aligning to the right of a sorted, unique index is a lookup of
+            # each target label, which a binary search does without building
+            # a join hash table. Missing labels gather out of bounds, so they
+            # become null like they would in the join.
+            gather_map = _indices_from_sorted_labels(
+                self.index._values, index._values
+            )._column.fillna(len(self))
+            data = self._gather(
+                gather_map, keep_index=False, nullify=True, check_bounds=False
+            )._data
+            result_index = index.copy(deep=False)
+        else:
+            lhs = cudf.DataFrame._from_data(self._data, index=self.index)
+            rhs = cudf.DataFrame._from_data({}, index=index)
+
+            # create a temporary column that we will later sort by
+            # to recover ordering after index alignment.
+            sort_col_id = f"__cudf_align_sort_{next(_align_sort_ids)}__"
+            if how == "left":
+                lhs[sort_col_id] = cudf.core.column.arange(len(lhs))
+            elif how == "right":
+                rhs[sort_col_id] = cudf.core.column.arange(len(rhs))
+
+            result = lhs.join(rhs, how=how, sort=sort)
+            if how in ("left", "right"):
+                result = result.sort_values(sort_col_id)
+                del result[sort_col_id]
+            data = result._data
+            result_index = result.index
+
+        result = self.__class__._from_data(data, index=result_index)
         result._data.multiindex = self._data.multiindex
         result._data._level_names = self._data._level_names
         result.index.names = self.index.names
@@ -1166,12 +1260,27 @@ class IndexedFrame(Frame):
                 "decimals must be an integer, a dict-like or a Series"
             )
 
-        cols = {
-            name: col.round(decimals[name], how=how)
-            if (name in decimals and _is_non_decimal_numeric_dtype(col.dtype))
-            else col.copy(deep=True)
-            for name, col in self._data.items()
-        }
+        if not any(
+            name in self._data
+            and _is_non_decimal_numeric_dtype(self._data[name].dtype)
+            for name in decimals
+        ):
+            # Nothing to round.
+            return self.copy()
+
+        cols = {}
+        for name, col in self._data.items():
+            places = decimals.get(name)
+            if (
+                places is None
+                or not _is_non_decimal_numeric_dtype(col.dtype)
+                # libcudf returns integers unchanged for non-negative
+                # decimals, so skip the round kernel and just copy.
+                or (places >= 0 and is_integer_dtype(col.dtype))
+            ):
+                cols[name] = col.copy()
+            else:
+                cols[name] = col.round(places, how=how)
 
         return self.__class__._from_data(
             data=cudf.core.column_accessor.ColumnAccessor(
@@ -1483,20 +1592,32 @@ class IndexedFrame(Frame):
             less than `thresh` non-null values.
         """
         if subset is None:
-            subset = self._column_names
-        elif (
-            not np.iterable(subset)
-            or isinstance(subset, str)
-            or isinstance(subset, tuple)
-            and subset in self._data.names
-        ):
-            subset = (subset,)
-        diff = set(subset) - set(self._data)
-        if len(diff) != 0:
-            raise KeyError(f"columns {diff} do not exist")
+            if self._num_columns == 0:
+                return self.copy(deep=True)
+            # Every data column is a key; no name lookups are needed.
+            num_index_columns = len(self._index._data)
+            keys = list(
+                range(num_index_columns, num_index_columns + self._num_columns)
+            )
+        else:
+            if (
+                not np.iterable(subset)
+                or isinstance(subset, str)
+                or isinstance(subset, tuple)
+                and subset in self._data.names
+            ):
+                subset = (subset,)
+            positions = self._data._name_to_position
+            if any(name not in positions for name in subset):
+                diff = set(subset) - set(positions)
+                raise KeyError(f"columns {diff} do not exist")
 
-        if len(subset) == 0:
-            return self.copy(deep=True)
+            if len(subset) == 0:
+                return self.copy(deep=True)
+
+            keys = self._positions_from_column_names(
+                subset, offset_by_index_columns=True
+            )
 
         data_columns = [
             col.nans_to_nulls()
@@ -1509,9 +1630,7 @@ class IndexedFrame(Frame):
             libcudf.stream_compaction.drop_nulls(
                 [*self._index._data.columns, *data_columns],
                 how=how,
-                keys=self._positions_from_column_names(
-                    subset, offset_by_index_columns=True
-                ),
+                keys=keys,
                 thresh=thresh,
             ),
             self._column_names,
@@ -1523,26 +1642,32 @@ class IndexedFrame(Frame):
 
         Rows corresponding to `False` is dropped.
         """
-        boolean_mask = cudf.core.column.as_column(boolean_mask)
+        if not isinstance(boolean_mask, ColumnBase):
+            boolean_mask = cudf.core.column.as_column(boolean_mask)
         if not is_bool_dtype(boolean_mask.dtype):
             raise ValueError("boolean_mask is not boolean type.")
 
         return self._from_columns_like_self(
             libcudf.stream_compaction.apply_boolean_mask(
-                list(self._index._columns + self._columns), boolean_mask
+                [*self._index._columns, *self._columns], boolean_mask
             ),
             column_names=self._column_names,
             index_names=self._index.names,
         )
 
-    def take(self, indices, axis=0):
+    def take(self, indices, axis=0, check_bounds=True):
         """Return a new frame containing the rows specified by *indices*.
 
         Parameters
         ----------
         indices : array-like
-            Array of ints indicating which positions to take.
+            Array of ints indicating which positions to take, or a boolean
+            mask of the same length as the frame.
         axis : Unsupported
+        check_bounds : bool, default True
+            Whether to verify that integer *indices* are in bounds. Passing
+            ``False`` skips the check; out of bounds indices then result in
+            undefined behavior.
 
         Returns
         -------
@@ -1577,7 +1702,15 @@ class IndexedFrame(Frame):
         if self._get_axis_from_axis_arg(axis) != 0:
             raise NotImplementedError("Only axis=0 is supported.")
 
-        return self._gather(indices)
+        indices = cudf.core.column.as_column(indices)
+        if is_bool_dtype(indices.dtype):
+            if len(indices) != len(self):
+                raise IndexError(
+                    f"Boolean mask has length {len(indices)}, "
+                    f"expected {len(self)}."
+                )
+            return self._apply_boolean_mask(indices)
+        return self._gather(indices, check_bounds=check_bounds)
 
     def _reset_index(self, level, drop, col_level=0, col_fill=""):
         """Shared path for DataFrame.reset_index and Series.reset_index."""
@@ -1604,25 +1737,27 @@ class IndexedFrame(Frame):
         if drop:
             return self._data, index
 
+        multiindex = self._data.multiindex
+        if multiindex:
+            # Every new label shares the same fill values, so build them once
+            # and only swap in the name at `col_level`.
+            label = [col_fill] * self._data.nlevels
+            set_level = col_level in range(self._data.nlevels)
+
         new_column_data = {}
         for name, col in zip(data_names, data_columns):
             if name == "index" and "index" in self._data:
                 name = "level_0"
-            name = (
-                tuple(
-                    name if i == col_level else col_fill
-                    for i in range(self._data.nlevels)
-                )
-                if self._data.multiindex
-                else name
-            )
+            if multiindex:
+                if set_level:
+                    label[col_level] = name
+                name = tuple(label)
             new_column_data[name] = col
         # This is to match pandas where the new data columns are always
         # inserted to the left of existing data columns.
+        new_column_data.update(zip(self._data.names, self._data.columns))
         return (
-            ColumnAccessor(
-                {**new_column_data, **self._data}, self._data.multiindex
-            ),
+            ColumnAccessor._create_unsafe(new_column_data, multiindex),
             index,
         )
 
@@ -1640,12 +1775,13 @@ class IndexedFrame(Frame):
         if len(self) == 0:
             return self.copy()
 
-        pd_offset = pd.tseries.frequencies.to_offset(offset)
-        to_search = op(pd.Timestamp(self._index._column[idx]), pd_offset)
+        pd_offset = _to_offset(offset)
+        endpoint = pd.Timestamp(self._index._column.element_indexing(idx))
+        to_search = op(endpoint, pd_offset)
         if (
             idx == 0
             and not isinstance(pd_offset, pd.tseries.offsets.Tick)
-            and pd_offset.is_on_offset(pd.Timestamp(self._index[0]))
+            and pd_offset.is_on_offset(endpoint)
         ):
             # Special handle is required when the start time of the index
             # is on the end of the offset. See pandas gh29623 for detail.
@@ -1868,6 +2004,12 @@ class IndexedFrame(Frame):
                 "Cannot take a sample larger than 0 when axis is empty."
             )
 
+        if n > size and not replace:
+            raise ValueError(
+                "Cannot take a larger sample than population when "
+                "'replace=False'"
+            )
+
         if isinstance(random_state, cp.random.RandomState):
             lib = cp
         elif isinstance(random_state, np.random.RandomState):
@@ -1892,8 +2034,15 @@ class IndexedFrame(Frame):
                     "Weights and axis to be sampled must be of same length."
                 )
 
-            weights = lib.asarray(weights)
-            weights = weights / weights.sum()
+            if isinstance(weights, (list, tuple)):
+                # A host sequence is always copied into a fresh array, so
+                # it is safe to normalize that array in place.
+                weights = lib.asarray(weights, dtype=np.float64)
+                weights /= weights.sum()
+            else:
+                # Arrays may be zero-copy views of the caller's data.
+                weights = lib.asarray(weights)
+                weights = weights / weights.sum()
 
         if axis == 0:
             return self._sample_axis_0(
@@ -1917,14 +2066,56 @@ class IndexedFrame(Frame):
         random_state: Union[np.random.RandomState, cp.random.RandomState],
         ignore_index: bool,
     ):
-        try:
-            gather_map_array = random_state.choice(
-                len(self), size=n, replace=replace, p=weights
+        size = len(self)
+        use_device_shuffle = (
+            isinstance(random_state, cp.random.RandomState)
+            and weights is None
+            and not replace
+        )
+        if use_device_shuffle and size // 4 <= n <= size:
+            # libcudf shuffles the row positions directly, which is cheaper
+            # than cupy's argsort of random keys.
+            seed = int(random_state.randint(np.iinfo(np.int32).max))
+            return self._from_columns_like_self(
+                libcudf.copying.sample(
+                    list(self._columns)
+                    if ignore_index
+                    else [*self._index._columns, *self._columns],
+                    n,
+                    False,
+                    seed,
+                ),
+                self._column_names,
+                None if ignore_index else self._index.names,
             )
-        except NotImplementedError as e:
+        elif use_device_shuffle and n > 0:
+            # cupy samples without replacement by permuting (argsorting) all
+            # ``size`` positions. For small ``n`` it is much cheaper to draw
+            # candidates with replacement until ``n`` of them are distinct,
+            # then take a random ordering of those.
+            candidates = cp.empty(0, dtype=np.int64)
+            while len(candidates) < n:
+                candidates = cp.unique(
+                    cp.concatenate(
+                        [candidates, random_state.randint(0, size, 2 * n)]
+                    )
+                )
+            gather_map_array = candidates[
+                random_state.permutation(len(candidates))[:n]
+            ]
+        elif (
+            isinstance(random_state, cp.random.RandomState)
+            and weights is not None
+            and not replace
+        ):
+            # cupy cannot draw weighted samples without replacement.
             raise NotImplementedError(
                 "Random sampling with cupy does not support these inputs."
-            ) from e
+            )
+        else:
+            gather_map_array = random_state.choice(
+                size, size=n, replace=replace, p=weights
+            )
 
         return self._gather(
             cudf.core.column.as_column(gather_map_array),
@@ -1962,8 +2153,12 @@ class IndexedFrame(Frame):
         if operands is NotImplemented:
             return NotImplemented
 
+        # Every result column has the length of its operands, so the
+        # accessor can take ownership of the dict without validation.
         return self._from_data(
-            ColumnAccessor(type(self)._colwise_binop(operands, op)),
+            ColumnAccessor._create_unsafe(
+                type(self)._colwise_binop(operands, op)
+            ),
             index=out_index,
         )
 
@@ -1993,7 +2188,7 @@ class IndexedFrame(Frame):
 
         if ret is not None:
             # pandas bitwise operations return bools if indexes are misaligned.
-            if "bitwise" in fname:
+            if fname in _BITWISE_UFUNCS:
                 reflect = self is not inputs[0]
                 other = inputs[0] if reflect else inputs[1]
                 if isinstance(other, self.__class__) and not self.index.equals(
@@ -2003,7 +2198,7 @@ class IndexedFrame(Frame):
             return ret
 
         # Attempt to dispatch all other functions to cupy.
-        cupy_func = getattr(cp, fname)
+        cupy_func = getattr(cp, fname, None)
         if cupy_func:
             if ufunc.nin == 2:
                 other = inputs[self is inputs[0]]
@@ -2381,11 +2576,21 @@ class IndexedFrame(Frame):
 
             _drop_columns(out, target, errors)
         elif axis in (0, "index"):
-            dropped = _drop_rows_by_labels(out, target, level, errors)
-
+            source = out
             if columns is not None:
-                columns = _get_host_unique(columns)
-                _drop_columns(dropped, columns, errors)
+                # Prune columns before dropping rows so that the row removal
+                # never touches the data of columns that are dropped anyway.
+                if inplace:
+                    source = out.copy(deep=False)
+                _drop_columns(source, _get_host_unique(columns), errors)
+
+            if is_list_like(target) and len(target) == 0:
+                # Nothing to drop, so skip building and applying a row mask.
+                # `source` is the deep copy made above unless dropping in
+                # place, so the result never aliases the caller's columns.
+                dropped = source
+            else:
+                dropped = _drop_rows_by_labels(source, target, level, errors)
 
             out._data = dropped._data
             out._index = dropped._index
@@ -2420,7 +2625,9 @@ class IndexedFrame(Frame):
             index=index,
         )
 
-        if not ignore_index and self._index is not None:
+        # A flat index already carries its name through `index_names`, but
+        # MultiIndex level names are not keyed by column so must be restored.
+        if not ignore_index and isinstance(self._index, cudf.MultiIndex):
             res.index.names = self._index.names
         return res
 
@@ -1497,7 +1497,7 @@ class MultiIndex(Frame, BaseIndex, NotIterable):
 
     @annotate("MULTIINDEX_MEMORY_USAGE", color="green", domain="cudf_python")
     def memory_usage(self, deep=False):
-        usage = sum(super().memory_usage(deep=deep).values())
+        usage = sum(super().memory_usage(deep=deep)[1])
         if self.levels:
             for level in self.levels:
                 usage += level.memory_usage(deep=deep)
@@ -855,7 +855,7 @@ class Series(SingleColumnFrame, IndexedFrame, Serializable):
 
     @annotate("SERIES_MEMORY_USAGE", color="green", domain="cudf_python")
     def memory_usage(self, index=True, deep=False):
-        return sum(super().memory_usage(index, deep).values())
+        return sum(super().memory_usage(index, deep)[1])
 
     @annotate("SERIES_ARRAY_FUNCTION", color="green", domain="cudf_python")
     def __array_function__(self, func, types, args, kwargs):
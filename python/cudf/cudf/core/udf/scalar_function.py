@@ -13,6 +13,7 @@ from cudf.core.udf.utils import (
     _get_kernel,
     _get_udf_return_type,
     _mask_get,
+    _mask_set,
 )
 
 
@@ -56,6 +57,7 @@ def _get_scalar_kernel(sr, func, args):
         "cuda": cuda,
         "Masked": Masked,
         "_mask_get": _mask_get,
+        "_mask_set": _mask_set,
         "pack_return": pack_return,
     }
     kernel_string = _scalar_kernel_string_from_template(sr, args=args)
@@ -32,7 +32,8 @@ def _kernel(retval, size, {input_columns}, {input_offsets}, {extra_args}):
         # pack up the return values and set them
         ret_masked = pack_return(ret)
         ret_data_arr[i] = ret_masked.value
-        ret_mask_arr[i] = ret_masked.valid
+        if ret_masked.valid:
+            _mask_set(ret_mask_arr, i)
 """
 
 scalar_kernel_template = """
@@ -48,5 +49,6 @@ def _kernel(retval, size, input_col_0, offset_0, {extra_args}):
 
         ret_masked = pack_return(ret)
         ret_data_arr[i] = ret_masked.value
-        ret_mask_arr[i] = ret_masked.valid
+        if ret_masked.valid:
+            _mask_set(ret_mask_arr, i)
 """
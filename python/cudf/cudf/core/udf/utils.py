@@ -5,7 +5,7 @@ import numpy as np
 from numba import cuda, typeof
 from numba.core.errors import TypingError
 from numba.np import numpy_support
-from numba.types import Poison, Tuple, boolean, int64, void
+from numba.types import Poison, Tuple, int64, void
 from nvtx import annotate
 
 from cudf.core.dtypes import CategoricalDtype
@@ -128,8 +128,8 @@ def _construct_signature(frame, return_type, args):
     and offsets. Skips columns with unsupported dtypes.
     """
 
-    # Tuple of arrays, first the output data array, then the mask
-    return_type = Tuple((return_type[::1], boolean[::1]))
+    # Tuple of arrays, first the output data array, then the bitmask
+    return_type = Tuple((return_type[::1], libcudf_bitmask_type[::1]))
     offsets = []
     sig = [return_type, int64]
     for col in _supported_cols_from_frame(frame).values():
@@ -148,20 +148,28 @@ def _mask_get(mask, pos):
     return (mask[pos // MASK_BITSIZE] >> (pos % MASK_BITSIZE)) & 1
 
 
-def _generate_cache_key(frame, func: Callable):
+@cuda.jit(device=True)
+def _mask_set(mask, pos):
+    """Mark mask[pos] as valid."""
+    cuda.atomic.or_(mask, pos // MASK_BITSIZE, 1 << (pos % MASK_BITSIZE))
+
+
+def _generate_cache_key(frame, func: Callable, args=()):
     """Create a cache key that uniquely identifies a compilation.
 
     A new compilation is needed any time any of the following things change:
     - The UDF itself as defined in python by the user
     - The types of the columns utilized by the UDF
     - The existence of the input columns masks
+    - The types of the extra arguments passed to the UDF
     """
     return (
         *cudautils.make_cache_key(
             func, tuple(_all_dtypes_from_frame(frame).values())
         ),
-        *(col.mask is None for col in frame._data.values()),
-        *frame._data.keys(),
+        *(col.mask is None for col in frame._data.columns),
+        *frame._data.names,
+        *(typeof(arg) for arg in args),
     )
 
 
@@ -189,10 +197,10 @@ def _compile_or_get(frame, func, args, kernel_getter=None):
     """
 
     # check to see if we already compiled this function
-    cache_key = _generate_cache_key(frame, func)
-    if precompiled.get(cache_key) is not None:
-        kernel, masked_or_scalar = precompiled[cache_key]
-        return kernel, masked_or_scalar
+    cache_key = _generate_cache_key(frame, func, args)
+    cached = precompiled.get(cache_key)
+    if cached is not None:
+        return cached
 
     # precompile the user udf to get the right return type.
     # could be a MaskedType or a scalar type.
@@ -197,6 +197,26 @@ def test_init_unaligned_with_index():
     assert_eq(pdf, gdf, check_dtype=False)
 
 
+@pytest.mark.parametrize("index", [[7, 2, 5, 1], [1, 3], [10, 0]])
+def test_init_with_index_sorted_series(index):
+    pdf = pd.DataFrame(
+        {
+            "a": pd.Series([1.0, 2.0, 3.0], index=[1, 2, 3]),
+            "b": pd.Series(["x", "y", "z"], index=[1, 5, 7]),
+        },
+        index=index,
+    )
+    gdf = cudf.DataFrame(
+        {
+            "a": cudf.Series([1.0, 2.0, 3.0], index=[1, 2, 3]),
+            "b": cudf.Series(["x", "y", "z"], index=[1, 5, 7]),
+        },
+        index=index,
+    )
+
+    assert_eq(pdf, gdf)
+
+
 def test_series_basic():
     # Make series from buffer
     a1 = np.arange(10, dtype=np.float64)
@@ -339,6 +359,56 @@ def test_dataframe_drop_columns(pdf, columns, inplace):
     assert_eq(expected, actual)
 
 
+def test_dataframe_drop_columns_device_labels():
+    pdf = pd.DataFrame({"a": range(10), "b": range(10, 20), "c": range(10)})
+    gdf = cudf.from_pandas(pdf)
+
+    expected = pdf.drop(columns=["a", "b"])
+    assert_eq(expected, gdf.drop(columns=cudf.Series(["a", "b", "a"])))
+    assert_eq(expected, gdf.drop(columns=cudf.Index(["b", "a"])))
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        pd.RangeIndex(4),
+        pd.MultiIndex.from_tuples(
+            [("a", 0), ("a", 1), ("b", 0), ("b", 1)], names=["x", "y"]
+        ),
+    ],
+)
+def test_dataframe_drop_rows_multiindex_columns(index):
+    pdf = pd.DataFrame(
+        np.arange(8).reshape(4, 2),
+        index=index,
+        columns=pd.MultiIndex.from_tuples(
+            [("p", "q"), ("p", "r")], names=["c0", "c1"]
+        ),
+    )
+    gdf = cudf.from_pandas(pdf)
+    labels = [0, 2] if isinstance(index, pd.RangeIndex) else ["a"]
+
+    assert_eq(pdf.drop(index=labels), gdf.drop(index=labels))
+
+
+def test_dataframe_drop_result_is_independent():
+    gdf = cudf.DataFrame({"a": [1.0, None, 3.0], "b": [4, 5, 6]})
+    expected = gdf.copy()
+
+    result = gdf.drop(columns="b")
+    result.dropna(inplace=True)
+    assert_eq(gdf, expected)
+
+    result = gdf.drop(columns="a")
+    result["b"][0:2] = 0
+    assert_eq(gdf, expected)
+
+    result = gdf.drop(labels=[])
+    result.dropna(inplace=True)
+    result["b"][0:1] = 0
+    assert_eq(gdf, expected)
+
+
 @pytest.mark.parametrize(
     "pdf",
     [
@@ -350,7 +420,7 @@ def test_dataframe_drop_columns(pdf, columns, inplace):
 )
 @pytest.mark.parametrize(
     "labels",
-    [[1], [0], 1, 5, [5, 9], pd.Index([0, 1, 2, 3, 4, 5, 6, 7, 8, 9])],
+    [[], [1], [0], 1, 5, [5, 9], pd.Index([0, 1, 2, 3, 4, 5, 6, 7, 8, 9])],
 )
 @pytest.mark.parametrize("inplace", [True, False])
 def test_dataframe_drop_labels_axis_0(pdf, labels, inplace):
@@ -3590,6 +3660,26 @@ def test_dataframe_round(decimals):
     assert_eq(result, expected)
 
 
+def test_dataframe_round_result_is_independent():
+    gdf = cudf.DataFrame({"a": [1.25, 2.5, 3.75], "b": [1, 2, 3]})
+    expected = gdf.copy()
+
+    result = gdf.round({"a": 1})
+    result["b"][0:2] = 9
+
+    assert_eq(gdf, expected)
+
+
+def test_dataframe_round_noop_result_is_independent():
+    gdf = cudf.DataFrame({"a": [1.5, None, 3.5]})
+    expected = gdf.copy()
+
+    result = gdf.round({"missing": 1})
+    result.fillna(0, inplace=True)
+
+    assert_eq(gdf, expected)
+
+
 @pytest.mark.parametrize(
     "data",
     [
@@ -7253,6 +7343,51 @@ def test_sample_reproducibility(replace, random_state_lib):
     assert_eq(expected, out)
 
 
+@pytest.mark.parametrize("n", [1, 10, 255])
+def test_sample_small_n_without_replace(n):
+    df = cudf.DataFrame({"a": cupy.arange(0, 1024)})
+
+    expected = df.sample(n, random_state=cp.random.RandomState(10))
+    out = df.sample(n, random_state=cp.random.RandomState(10))
+
+    assert_eq(expected, out)
+    assert len(out) == n
+    assert out["a"].is_unique
+    assert out.index.equals(cudf.Index(out["a"].values))
+
+
+@pytest.mark.parametrize("axis", [0, 1])
+def test_sample_n_larger_than_population_without_replace(axis):
+    df = cudf.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+    random_state = cp.random.RandomState(0) if axis == 0 else 0
+
+    with pytest.raises(ValueError, match="larger sample than population"):
+        df.sample(n=df.shape[axis] + 1, axis=axis, random_state=random_state)
+
+
+@pytest.mark.parametrize("n", [256, 512, 1023])
+def test_sample_large_n_without_replace(n):
+    df = cudf.DataFrame(
+        {"a": cupy.arange(0, 1024), "b": cupy.arange(0, 1024) * 0.5},
+        index=cupy.arange(100, 100 + 2 * 1024, 2),
+    )
+
+    out = df.sample(n, random_state=cp.random.RandomState(10))
+    assert len(out) == n
+    assert out.index.is_unique
+    assert out.index.isin(df.index).all()
+    assert_eq(out, df.loc[out.index])
+
+    out = df.sample(
+        n, random_state=cp.random.RandomState(10), ignore_index=True
+    )
+    assert len(out) == n
+    assert_eq(out.index, cudf.RangeIndex(n))
+    assert out["a"].is_unique
+    assert out["a"].isin(df["a"]).all()
+    assert_eq(out["b"], out["a"] * 0.5, check_names=False)
+
+
 @pytest.mark.parametrize("axis", [0, 1])
 def test_sample_invalid_n_frac_combo(axis):
     n, frac = 2, 0.5
@@ -8574,6 +8709,17 @@ def test_explode(data, labels, ignore_index, p_index, label_to_explode):
     assert_eq(expect, got, check_dtype=False)
 
 
+def test_explode_non_list_result_is_independent():
+    gdf = cudf.DataFrame({"a": [1.0, None, 3.0], "b": [4, 5, 6]})
+    expected = gdf.copy()
+
+    result = gdf.explode("b")
+    result.dropna(inplace=True)
+    result["b"][0:1] = 0
+
+    assert_eq(gdf, expected)
+
+
 @pytest.mark.parametrize(
     "df,ascending,expected",
     [
@@ -514,6 +514,42 @@ def test_series_loc_datetime():
     )
 
 
+@pytest.mark.parametrize(
+    "index",
+    [
+        pd.DatetimeIndex(
+            [
+                "2001-01-03",
+                "2001-01-01",
+                "2001-01-05",
+                "2001-01-02",
+                "2001-01-04",
+            ]
+        ),
+        pd.DatetimeIndex(
+            ["2001-01-03", None, "2001-01-05", "2001-01-01", "2001-01-04"]
+        ),
+    ],
+    ids=["shuffled", "with_nat"],
+)
+@pytest.mark.parametrize(
+    "start, stop",
+    [
+        ("2001-01-03", None),
+        (None, "2001-01-04"),
+        ("2001-01-03", "2001-01-05"),
+        ("2001-01-05", "2001-01-03"),
+    ],
+    ids=["start", "stop", "both", "start_gt_stop"],
+)
+def test_series_loc_datetime_non_monotonic(index, start, stop):
+    ps = pd.Series([1, 2, 3, 4, 5], index=index)
+    gs = cudf.Series.from_pandas(ps)
+
+    assert not gs.index.is_monotonic
+    assert_eq(ps.loc[start:stop], gs.loc[start:stop])
+
+
 def test_series_loc_categorical():
     ps = pd.Series(
         [1, 2, 3, 4, 5], index=pd.Categorical(["a", "b", "c", "d", "e"])
@@ -776,6 +812,19 @@ def test_series_take_positional():
     assert_eq(expect, got)
 
 
+def test_take_boolean_mask():
+    pdf = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": ["a", "b", "c"]})
+    gdf = cudf.from_pandas(pdf)
+
+    mask = [True, False, True]
+
+    assert_eq(pdf[mask], gdf.take(mask))
+    assert_eq(pdf["b"][mask], gdf["b"].take(mask))
+
+    with pytest.raises(IndexError):
+        gdf.take([True, False])
+
+
 @pytest.mark.parametrize("nelem", [0, 1, 5, 20, 100])
 @pytest.mark.parametrize("slice_start", [None, 0, 1, 3, 10, -10])
 @pytest.mark.parametrize("slice_end", [None, 0, 1, 30, 50, -1])
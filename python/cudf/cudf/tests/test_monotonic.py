@@ -317,3 +317,25 @@ testdata = [
 def test_is_monotonic_always_falls_for_null(data, expected):
     assert_eq(expected, data.is_monotonic_increasing)
     assert_eq(expected, data.is_monotonic_decreasing)
+
+
+def test_is_monotonic_updates_after_inplace_setitem():
+    sr = Series([1, 2, 3, 4])
+    assert sr.is_monotonic_increasing
+    assert not sr.is_monotonic_decreasing
+
+    sr[1:3] = 10
+    assert not sr.is_monotonic_increasing
+
+    sr[:] = 0
+    assert sr.is_monotonic_increasing
+    assert sr.is_monotonic_decreasing
+
+
+def test_is_monotonic_updates_after_inplace_categorical_fill():
+    sr = Series(["a", "b", "c", "d"], dtype="category")
+    assert sr.is_monotonic_increasing
+
+    sr[0:2] = "d"
+    assert not sr.is_monotonic_increasing
+    assert not sr.is_monotonic_decreasing
@@ -696,6 +696,15 @@ def test_series_round(arr, decimals):
     assert_eq(result, expected)
 
 
+def test_series_round_integer_result_is_independent():
+    s = cudf.Series([1, 2, 3])
+    result = s.round()
+    result[0:2] = 9
+
+    assert_eq(s, cudf.Series([1, 2, 3]))
+    assert_eq(result, cudf.Series([9, 9, 3]))
+
+
 def test_series_round_half_up():
     s = cudf.Series([0.0, 1.0, 1.2, 1.7, 0.5, 1.5, 2.5, None])
     expect = cudf.Series([0.0, 1.0, 1.0, 2.0, 1.0, 2.0, 3.0, None])
@@ -9,11 +9,30 @@ from cudf.core._compat import PANDAS_GE_120, PANDAS_LE_122
 from cudf.testing._utils import assert_eq, assert_exceptions_equal
 
 
-@pytest.mark.parametrize("df", [pd.DataFrame({"a": [1, 2, 3]})])
+@pytest.fixture(scope="module")
+def int_frames():
+    """A pandas frame and its cudf copy, built once per module.
+
+    Tests mutate the frames, so they must work on copies.
+    """
+    pdf = pd.DataFrame({"a": [1, 2, 3]})
+    return pdf, cudf.from_pandas(pdf)
+
+
+@pytest.fixture(
+    scope="module",
+    params=[{"a": [1, 2, 3]}, {"a": ["x", "y", "z"]}],
+    ids=["int", "str"],
+)
+def setitem_frames(request):
+    pdf = pd.DataFrame(request.param)
+    return pdf, cudf.from_pandas(pdf)
+
+
 @pytest.mark.parametrize("arg", [[True, False, True], [True, True, True]])
 @pytest.mark.parametrize("value", [0, -1])
-def test_dataframe_setitem_bool_mask_scaler(df, arg, value):
-    gdf = cudf.from_pandas(df)
+def test_dataframe_setitem_bool_mask_scaler(int_frames, arg, value):
+    df, gdf = (frame.copy() for frame in int_frames)
 
     df[arg] = value
     gdf[arg] = value
@@ -33,16 +52,12 @@ def test_dataframe_setitem_scaler_bool():
     assert_eq(df, gdf)
 
 
-@pytest.mark.parametrize(
-    "df",
-    [pd.DataFrame({"a": [1, 2, 3]}), pd.DataFrame({"a": ["x", "y", "z"]})],
-)
 @pytest.mark.parametrize("arg", [["a"], "a", "b"])
 @pytest.mark.parametrize(
     "value", [-10, pd.DataFrame({"a": [-1, -2, -3]}), "abc"]
 )
-def test_dataframe_setitem_columns(df, arg, value):
-    gdf = cudf.from_pandas(df)
+def test_dataframe_setitem_columns(setitem_frames, arg, value):
+    df, gdf = (frame.copy() for frame in setitem_frames)
     cudf_replace_value = value
 
     if isinstance(cudf_replace_value, pd.DataFrame):
@@ -53,7 +68,6 @@ def test_dataframe_setitem_columns(df, arg, value):
     assert_eq(df, gdf, check_dtype=False)
 
 
-@pytest.mark.parametrize("df", [pd.DataFrame({"a": [1, 2, 3]})])
 @pytest.mark.parametrize("arg", [["b", "c"]])
 @pytest.mark.parametrize(
     "value",
@@ -69,8 +83,8 @@ def test_dataframe_setitem_columns(df, arg, value):
         np.timedelta64(34234324234324234, "ns"),
     ],
 )
-def test_dataframe_setitem_new_columns(df, arg, value):
-    gdf = cudf.from_pandas(df)
+def test_dataframe_setitem_new_columns(int_frames, arg, value):
+    df, gdf = (frame.copy() for frame in int_frames)
     cudf_replace_value = value
 
     if isinstance(cudf_replace_value, pd.DataFrame):
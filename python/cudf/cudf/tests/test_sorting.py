@@ -70,6 +70,19 @@ def test_series_sort_values_ignore_index(ignore_index):
     assert_eq(expect, got)
 
 
+@pytest.mark.parametrize("ignore_index", [True, False])
+@pytest.mark.parametrize(
+    "data,ascending", [([1, 2, 2, 5], True), ([5, 2, 2, 1], False)]
+)
+def test_series_sort_values_presorted(data, ascending, ignore_index):
+    gsr = Series(data, index=[10, 20, 30, 40])
+    psr = gsr.to_pandas()
+
+    expect = psr.sort_values(ascending=ascending, ignore_index=ignore_index)
+    got = gsr.sort_values(ascending=ascending, ignore_index=ignore_index)
+    assert_eq(expect, got)
+
+
 @pytest.mark.parametrize(
     "nelem,sliceobj", list(product([10, 100], sort_slice_args))
 )
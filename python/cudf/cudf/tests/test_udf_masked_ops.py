@@ -668,3 +668,20 @@ def test_masked_udf_caching():
     data.apply(f)
 
     assert precompiled.currsize == 1
+
+
+def test_masked_udf_caching_arg_types():
+    # Make sure the same function applied with extra
+    # arguments of different types recompiles
+
+    def f(x, c):
+        return x + c
+
+    data = cudf.Series([1, 2, 3])
+
+    precompiled.clear()
+    assert_eq(data.apply(f, args=(1,)), data + 1, check_dtype=False)
+    assert precompiled.currsize == 1
+
+    assert_eq(data.apply(f, args=(1.5,)), data + 1.5)
+    assert precompiled.currsize == 2
@@ -85,6 +85,32 @@ def gpu_mark_lt(arr, val, out, not_found):
             out[i] = not_found
 
 
+@cuda.jit
+def gpu_mark_in_range(arr, lo, hi, out):
+    i = cuda.grid(1)
+    if i < arr.size:
+        out[i] = lo <= arr[i] and arr[i] <= hi
+
+
+def mark_in_range(arr, lo, hi, mask=None):
+    """
+    Returns a boolean column that is True where ``lo <= arr <= hi``,
+    computed in a single pass over *arr*.
+
+    Parameters
+    ----------
+    arr : device array
+    lo : scalar
+    hi : scalar
+    mask : mask of the array
+    """
+    out = cuda.device_array(shape=(arr.shape), dtype=np.bool_)
+    if out.size > 0:
+        gpu_mark_in_range.forall(out.size)(arr, lo, hi, out)
+
+    return cudf.core.column.column.as_column(out).set_mask(mask)
+
+
 def find_index_of_val(arr, val, mask=None, compare="eq"):
     """
     Returns the indices of the occurrence of *val* in *arr*
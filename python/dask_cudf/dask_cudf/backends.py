@@ -30,10 +30,15 @@ from dask.dataframe.utils import (
 from dask.sizeof import sizeof as sizeof_dispatch
 
 import cudf
-from cudf.api.types import is_string_dtype
+from cudf import _lib as libcudf
+from cudf.api.types import _is_non_decimal_numeric_dtype, is_string_dtype
 
 from .core import DataFrame, Index, Series
 
+# Host-side placeholder values for string columns in `meta_nonempty`. Arrow
+# arrays are immutable, so one instance can back every placeholder.
+_NONEMPTY_STRINGS = pa.array(["cat", "dog"])
+
 get_parallel_type.register(cudf.DataFrame, lambda _: DataFrame)
 get_parallel_type.register(cudf.Series, lambda _: Series)
 get_parallel_type.register(cudf.BaseIndex, lambda _: Index)
@@ -42,63 +47,83 @@ get_parallel_type.register(cudf.BaseIndex, lambda _: Index)
 @meta_nonempty.register(cudf.BaseIndex)
 @annotate("_nonempty_index", color="green", domain="dask_cudf_python")
 def _nonempty_index(idx):
-    if isinstance(idx, cudf.core.index.RangeIndex):
-        return cudf.core.index.RangeIndex(2, name=idx.name)
-    elif isinstance(idx, cudf.core.index.DatetimeIndex):
-        start = "1970-01-01"
-        data = np.array([start, "1970-01-02"], dtype=idx.dtype)
-        values = cudf.core.column.as_column(data)
-        return cudf.core.index.DatetimeIndex(values, name=idx.name)
-    elif isinstance(idx, cudf.StringIndex):
-        return cudf.StringIndex(["cat", "dog"], name=idx.name)
-    elif isinstance(idx, cudf.core.index.CategoricalIndex):
-        key = tuple(idx._data.keys())
-        assert len(key) == 1
-        categories = idx._data[key[0]].categories
-        codes = [0, 0]
-        ordered = idx._data[key[0]].ordered
-        values = cudf.core.column.build_categorical_column(
-            categories=categories, codes=codes, ordered=ordered
-        )
-        return cudf.core.index.CategoricalIndex(values, name=idx.name)
-    elif isinstance(idx, cudf.core.index.GenericIndex):
-        return cudf.core.index.GenericIndex(
-            np.arange(2, dtype=idx.dtype), name=idx.name
-        )
-    elif isinstance(idx, cudf.core.multiindex.MultiIndex):
-        levels = [meta_nonempty(lev) for lev in idx.levels]
-        codes = [[0, 0] for i in idx.levels]
-        return cudf.core.multiindex.MultiIndex(
-            levels=levels, codes=codes, names=idx.names
-        )
-
+    # Index types with their own placeholder are registered below; the
+    # dispatcher resolves subclasses through the MRO.
     raise TypeError(f"Don't know how to handle index of type {type(idx)}")
 
 
+@meta_nonempty.register(cudf.RangeIndex)
+@annotate("_nonempty_range_index", color="green", domain="dask_cudf_python")
+def _nonempty_range_index(idx):
+    return cudf.RangeIndex(2, name=idx.name)
+
+
+@meta_nonempty.register(cudf.DatetimeIndex)
+@annotate("_nonempty_datetime_index", color="green", domain="dask_cudf_python")
+def _nonempty_datetime_index(idx):
+    data = np.array(["1970-01-01", "1970-01-02"], dtype=idx.dtype)
+    values = cudf.core.column.as_column(data)
+    return cudf.DatetimeIndex(values, name=idx.name)
+
+
+@meta_nonempty.register(cudf.StringIndex)
+@annotate("_nonempty_string_index", color="green", domain="dask_cudf_python")
+def _nonempty_string_index(idx):
+    return cudf.StringIndex(["cat", "dog"], name=idx.name)
+
+
+@meta_nonempty.register(cudf.CategoricalIndex)
+@annotate(
+    "_nonempty_categorical_index", color="green", domain="dask_cudf_python"
+)
+def _nonempty_categorical_index(idx):
+    key = tuple(idx._data.keys())
+    assert len(key) == 1
+    categories = idx._data[key[0]].categories
+    codes = [0, 0]
+    ordered = idx._data[key[0]].ordered
+    values = cudf.core.column.build_categorical_column(
+        categories=categories, codes=codes, ordered=ordered
+    )
+    return cudf.CategoricalIndex(values, name=idx.name)
+
+
+@meta_nonempty.register(cudf.core.index.GenericIndex)
+@annotate("_nonempty_generic_index", color="green", domain="dask_cudf_python")
+def _nonempty_generic_index(idx):
+    return cudf.core.index.GenericIndex(
+        np.arange(2, dtype=idx.dtype), name=idx.name
+    )
+
+
+@meta_nonempty.register(cudf.MultiIndex)
+@annotate("_nonempty_multi_index", color="green", domain="dask_cudf_python")
+def _nonempty_multi_index(idx):
+    levels = [meta_nonempty(lev) for lev in idx.levels]
+    codes = [[0, 0] for i in idx.levels]
+    return cudf.MultiIndex(levels=levels, codes=codes, names=idx.names)
+
+
 @annotate("_get_non_empty_data", color="green", domain="dask_cudf_python")
-def _get_non_empty_data(s):
-    if isinstance(s._column, cudf.core.column.CategoricalColumn):
+def _get_non_empty_data(col):
+    if isinstance(col, cudf.core.column.CategoricalColumn):
         categories = (
-            s._column.categories
-            if len(s._column.categories)
-            else [UNKNOWN_CATEGORIES]
+            col.categories if len(col.categories) else [UNKNOWN_CATEGORIES]
         )
         codes = cudf.core.column.full(size=2, fill_value=0, dtype="int32")
-        ordered = s._column.ordered
+        ordered = col.ordered
         data = cudf.core.column.build_categorical_column(
             categories=categories, codes=codes, ordered=ordered
         )
-    elif is_string_dtype(s.dtype):
-        data = pa.array(["cat", "dog"])
+    elif is_string_dtype(col.dtype):
+        data = cudf.core.column.as_column(_NONEMPTY_STRINGS)
     else:
-        if pd.api.types.is_numeric_dtype(s.dtype):
-            data = cudf.core.column.as_column(
-                cp.arange(start=0, stop=2, dtype=s.dtype)
-            )
+        if pd.api.types.is_numeric_dtype(col.dtype):
+            data = cudf.core.column.as_column(np.arange(2, dtype=col.dtype))
         else:
             data = cudf.core.column.as_column(
-                cp.arange(start=0, stop=2, dtype="int64")
-            ).astype(s.dtype)
+                np.arange(2, dtype="int64")
+            ).astype(col.dtype)
     return data
 
 
@@ -106,8 +131,8 @@ def _get_non_empty_data(s):
 @annotate("_nonempty_series", color="green", domain="dask_cudf_python")
 def _nonempty_series(s, idx=None):
     if idx is None:
-        idx = _nonempty_index(s.index)
-    data = _get_non_empty_data(s)
+        idx = meta_nonempty(s.index)
+    data = _get_non_empty_data(s._column)
 
     return cudf.Series(data, name=s.name, index=idx)
 
@@ -117,15 +142,18 @@ def _nonempty_series(s, idx=None):
 def meta_nonempty_cudf(x):
     idx = meta_nonempty(x.index)
     columns_with_dtype = dict()
-    res = cudf.DataFrame(index=idx)
-    for col in x._data.names:
-        dtype = str(x._data[col].dtype)
+    data = dict()
+    for col, column in x._data.items():
+        dtype = column.dtype
+        if isinstance(dtype, cudf.CategoricalDtype):
+            # Categorical dtypes are unhashable, and each placeholder must
+            # keep the categories of its own column.
+            data[col] = _get_non_empty_data(column)
+            continue
         if dtype not in columns_with_dtype:
-            columns_with_dtype[dtype] = cudf.core.column.as_column(
-                _get_non_empty_data(x[col])
-            )
-        res._data[col] = columns_with_dtype[dtype]
-    return res
+            columns_with_dtype[dtype] = _get_non_empty_data(column)
+        data[col] = columns_with_dtype[dtype]
+    return cudf.DataFrame._from_data(data, index=idx)
 
 
 @make_meta_dispatch.register((cudf.Series, cudf.DataFrame))
@@ -149,6 +177,12 @@ def _empty_series(name, dtype, index=None):
     return cudf.Series([], dtype=dtype, name=name, index=index)
 
 
+def _empty_column(dtype):
+    if isinstance(dtype, str) and dtype == "category":
+        return _empty_series(None, dtype)._column
+    return cudf.core.column.column_empty(0, dtype=dtype)
+
+
 @make_meta_obj.register(object)
 @annotate("make_meta_object_cudf", color="green", domain="dask_cudf_python")
 def make_meta_object_cudf(x, index=None):
@@ -187,9 +221,8 @@ def make_meta_object_cudf(x, index=None):
         index = make_meta_dispatch(index)
 
     if isinstance(x, dict):
-        return cudf.DataFrame(
-            {c: _empty_series(c, d, index=index) for (c, d) in x.items()},
-            index=index,
+        return cudf.DataFrame._from_data(
+            {c: _empty_column(d) for (c, d) in x.items()}, index=index
         )
     if isinstance(x, tuple) and len(x) == 2:
         return _empty_series(x[0], x[1], index=index)
@@ -198,10 +231,8 @@ def make_meta_object_cudf(x, index=None):
             raise ValueError(
                 f"Expected iterable of tuples of (name, dtype), got {x}"
             )
-        return cudf.DataFrame(
-            {c: _empty_series(c, d, index=index) for (c, d) in x},
-            columns=[c for c, d in x],
-            index=index,
+        return cudf.DataFrame._from_data(
+            {c: _empty_column(d) for (c, d) in x}, index=index
         )
     elif not hasattr(x, "dtype") and x is not None:
         # could be a string, a dtype object, or a python type. Skip `None`,
@@ -254,6 +285,12 @@ def categorical_dtype_cudf(categories=None, ordered=None):
 @tolist_dispatch.register((cudf.Series, cudf.BaseIndex))
 @annotate("tolist_cudf", color="green", domain="dask_cudf_python")
 def tolist_cudf(obj):
+    if not isinstance(obj, cudf.MultiIndex):
+        col = cudf.core.column.as_column(obj)
+        if _is_non_decimal_numeric_dtype(col.dtype) and not col.has_nulls():
+            # Fixed-width values without nulls convert straight from a host
+            # copy, skipping the intermediate arrow array.
+            return col.values_host.tolist()
     return obj.to_arrow().to_pylist()
 
 
@@ -267,6 +304,11 @@ def is_categorical_dtype_cudf(obj):
     return cudf.api.types.is_categorical_dtype(obj)
 
 
+def _quantile_fractions(q):
+    # Convert percentiles in [0, 100] to the [0, 1] fractions `quantile` takes.
+    return (np.asarray(q, dtype=np.float64) / 100.0).tolist()
+
+
 try:
     try:
         from dask.array.dispatch import percentile_lookup
@@ -280,10 +322,10 @@ try:
     def percentile_cudf(a, q, interpolation="linear"):
         # Cudf dispatch to the equivalent of `np.percentile`:
         # https://numpy.org/doc/stable/reference/generated/numpy.percentile.html
-        a = cudf.Series(a)
-        # a is series.
+        if not isinstance(a, cudf.Series):
+            a = cudf.Series(a)
         n = len(a)
-        if not len(a):
+        if not n:
             return None, n
         if isinstance(q, Iterator):
             q = list(q)
@@ -299,7 +341,7 @@ try:
             )
         if np.issubdtype(a.dtype, np.datetime64):
             result = a.quantile(
-                [i / 100.0 for i in q], interpolation=interpolation
+                _quantile_fractions(q), interpolation=interpolation
             )
 
             if q[0] == 0:
@@ -310,7 +352,7 @@ try:
             interpolation = "nearest"
         return (
             a.quantile(
-                [i / 100.0 for i in q], interpolation=interpolation
+                _quantile_fractions(q), interpolation=interpolation
             ).to_pandas(),
             n,
         )
@@ -332,14 +374,20 @@ def union_categoricals_cudf(
 
 @annotate("safe_hash", color="green", domain="dask_cudf_python")
 def safe_hash(frame):
-    return cudf.Series(frame.hash_values(), index=frame.index)
+    # `hash_values` already returns a Series carrying `frame.index`.
+    return frame.hash_values()
 
 
 @hash_object_dispatch.register((cudf.DataFrame, cudf.Series))
 @annotate("hash_object_cudf", color="green", domain="dask_cudf_python")
 def hash_object_cudf(frame, index=True):
     if index:
-        return safe_hash(frame.reset_index())
+        # Hash the index columns alongside the data instead of materializing
+        # `frame.reset_index()`; the result is positionally indexed either way.
+        return cudf.Series._from_data(
+            {None: libcudf.hash.hash(frame, "murmur3", ignore_index=False)},
+            index=cudf.RangeIndex(len(frame)),
+        )
     return safe_hash(frame)
 
 
@@ -357,14 +405,11 @@ def hash_object_cudf_index(ind, index=None):
 @group_split_dispatch.register((cudf.Series, cudf.DataFrame))
 @annotate("group_split_cudf", color="green", domain="dask_cudf_python")
 def group_split_cudf(df, c, k, ignore_index=False):
+    if c.dtype != np.int32:
+        c = c.astype(np.int32, copy=False)
     return dict(
-        zip(
-            range(k),
-            df.scatter_by_map(
-                c.astype(np.int32, copy=False),
-                map_size=k,
-                keep_index=not ignore_index,
-            ),
+        enumerate(
+            df.scatter_by_map(c, map_size=k, keep_index=not ignore_index)
         )
     )
 
@@ -372,7 +417,12 @@ def group_split_cudf(df, c, k, ignore_index=False):
 @sizeof_dispatch.register(cudf.DataFrame)
 @annotate("sizeof_cudf_dataframe", color="green", domain="dask_cudf_python")
 def sizeof_cudf_dataframe(df):
-    return int(df.memory_usage().sum())
+    # Sum the cached per-column sizes on the host rather than reducing the
+    # device Series returned by `DataFrame.memory_usage`.
+    return int(
+        sum(col.memory_usage for col in df._data.columns)
+        + df.index.memory_usage()
+    )
 
 
 @sizeof_dispatch.register((cudf.Series, cudf.BaseIndex))
@@ -604,6 +604,17 @@ def test_hash_object_dispatch(index):
     dd.assert_eq(result, expected)
 
 
+def test_hash_object_cudf_index_matches_reset_index():
+    obj = cudf.DataFrame(
+        {"x": ["a", "b", "c"], "y": [1, 2, 3], "z": [1, 1, 0]}, index=[2, 4, 6]
+    )
+    for frame in (obj, obj["x"], obj.set_index(["x", "z"])):
+        dd.assert_eq(
+            dgd.backends.hash_object_cudf(frame, index=True),
+            frame.reset_index().hash_values(),
+        )
+
+
 @pytest.mark.parametrize(
     "index",
     [
@@ -657,6 +668,18 @@ def test_make_meta_backends(index):
         dd.assert_eq(ddf._meta.dtypes, ddf._meta_nonempty.dtypes)
 
 
+def test_meta_nonempty_distinct_categories():
+    df = cudf.DataFrame(
+        {
+            "a": cudf.Series(["x", "y"], dtype="category"),
+            "b": cudf.Series(["u", "v"], dtype="category"),
+        }
+    )
+    res = meta_nonempty(df)
+    assert res["a"].dtype == df["a"].dtype
+    assert res["b"].dtype == df["b"].dtype
+
+
 @pytest.mark.parametrize(
     "data",
     [
@@ -839,3 +862,23 @@ def test_correct_meta():
 
     assert isinstance(emb, dd.DataFrame)
     assert isinstance(emb._meta, pd.DataFrame)
+
+
+@pytest.mark.parametrize(
+    "x",
+    [
+        {"a": "int64", "b": "float32", "c": "str", "d": "category"},
+        [("a", "int64"), ("b", "datetime64[ns]")],
+    ],
+)
+def test_make_meta_object_frame(x):
+    items = x.items() if isinstance(x, dict) else x
+    expected = cudf.DataFrame(
+        {c: dgd.backends._empty_series(c, d) for c, d in items}
+    )
+    got = dgd.backends.make_meta_object_cudf(x)
+
+    assert isinstance(got, cudf.DataFrame)
+    assert len(got) == 0
+    assert list(got.columns) == list(expected.columns)
+    assert list(got.dtypes) == list(expected.dtypes)
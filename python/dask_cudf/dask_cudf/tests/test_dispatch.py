@@ -1,5 +1,7 @@
 import pandas as pd
+import pytest
 
+from dask.dataframe.dispatch import tolist_dispatch
 from dask.dataframe.methods import is_categorical_dtype
 
 import cudf
@@ -14,3 +16,18 @@ def test_is_categorical_dispatch():
 
     assert is_categorical_dtype(pd.Index([1, 2, 3], dtype="category"))
     assert is_categorical_dtype(cudf.Index([1, 2, 3], dtype="category"))
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        cudf.Series([1, 2, 3]),
+        cudf.Series([1.5, None, 3.0]),
+        cudf.Series([True, False]),
+        cudf.Series(["a", None, "c"]),
+        cudf.Index([1, 2, 3]),
+        cudf.RangeIndex(3),
+    ],
+)
+def test_tolist_dispatch(obj):
+    assert tolist_dispatch(obj) == obj.to_arrow().to_pylist()